@@ -1,25 +1,38 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 import csv
 import time
 
+# Shared session so repeated requests reuse the same keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8"
+})
+
+# Only build parse-tree nodes for product containers, not the whole page
+ONLY_PRODUCTS = SoupStrainer('div', class_='tUxRFH')
+
+# Field selectors compiled once instead of on every product
+NAME_SELECTOR = sv.compile('div.KzDlHZ')
+PRICE_SELECTOR = sv.compile('div.Nx9bqj._4b5DiR')
+RATING_SELECTOR = sv.compile('div.XQDdHH')
+
 # Function to fetch HTML content
 def fetch(url):
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8"
-    }
-
-    response = requests.get(url, headers=headers)
+    response = SESSION.get(url, timeout=10)
     time.sleep(2)
     response.raise_for_status()
-    return response.text
+    return response.content
 
 # Function to extract product details
 def extract(html):
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, 'lxml', from_encoding='utf-8', parse_only=ONLY_PRODUCTS)
     products = []
 
     # Find all products
@@ -28,13 +41,13 @@ def extract(html):
     for product in pl:
 
         # Extract product name
-        name = product.find('div', class_='KzDlHZ').text.strip()
+        name = NAME_SELECTOR.select_one(product).text.strip()
 
         # Extract product price
-        price = product.find('div', class_='Nx9bqj _4b5DiR').text.strip()
+        price = PRICE_SELECTOR.select_one(product).text.strip()
 
         # Extract product rating
-        rating = product.find('div', class_='XQDdHH').text.strip()
+        rating = RATING_SELECTOR.select_one(product).text.strip()
 
         # Append the product data
         products.append({'Name': name, 'Price': price, 'Rating': rating})
@@ -49,9 +62,9 @@ def save(products, filename='flipkart_products.csv'):
 
     try:
         with open(filename, 'w', newline='', encoding='utf-8') as file:
-            writer = csv.DictWriter(file, fieldnames=['Name', 'Price', 'Rating'])
-            writer.writeheader()
-            writer.writerows(products)
+            writer = csv.writer(file)
+            writer.writerow(['Name', 'Price', 'Rating'])
+            writer.writerows((p['Name'], p['Price'], p['Rating']) for p in products)
         print(f"Data saved to {filename}")
     except:
         print(f"Error saving data")
@@ -1,18 +1,198 @@
+import asyncio
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
 import csv
-import json
+import orjson
 import time
+import random
 import logging
 import argparse
-from typing import List, Dict, Optional
-from datetime import datetime
+import queue
+import threading
+import os
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlencode
+from collections import defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from itertools import chain
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+}
+
+FIELDNAMES = ['Name', 'Price', 'Rating', 'Link', 'Scraped_At']
+
+# Only these HTTP statuses are worth retrying; other errors fail fast
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+BACKOFF_JITTER = 1.0
+# Longest Retry-After we will wait out; anything longer gives up on the URL
+RETRY_AFTER_MAX = 60.0
+
+logger = logging.getLogger(__name__)
+
+
+def setup_logging():
+    """Configure root logging once; called from main() before --verbose is applied."""
+    if logging.getLogger().handlers:
+        return
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('scraper.log'),
+            logging.StreamHandler()
+        ]
+    )
+
+
+class RateLimiter:
+    """Space requests at a fixed interval of 1 / `rate_per_sec` seconds, without bursting."""
+    
+    def __init__(self, rate_per_sec: float):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate_per_sec: Maximum requests per second; 0 or less disables limiting
+        """
+        self.interval = 1 / rate_per_sec if rate_per_sec > 0 else 0.0
+        self.next_allowed_time = float('-inf')
+        self.blocked_until = float('-inf')
+    
+    def _reserve(self) -> float:
+        """Claim the next request slot and return its monotonic start time."""
+        slot = max(time.monotonic(), self.next_allowed_time, self.blocked_until)
+        self.next_allowed_time = slot + self.interval
+        return slot
+    
+    def defer(self, seconds: float):
+        """Hold back every request for at least `seconds`, e.g. after a Retry-After."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+    
+    def wait(self) -> float:
+        """Block until a request may be sent. Returns the time slept."""
+        start = time.monotonic()
+        while True:
+            slot = self._reserve()
+            delay = slot - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            # A deferral made while sleeping invalidates the slot; take a new one
+            if slot >= self.blocked_until:
+                return time.monotonic() - start
+    
+    async def async_wait(self) -> float:
+        """Asynchronous variant of `wait`."""
+        start = time.monotonic()
+        while True:
+            slot = self._reserve()
+            delay = slot - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            # A deferral made while sleeping invalidates the slot; take a new one
+            if slot >= self.blocked_until:
+                return time.monotonic() - start
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given zero-based attempt."""
+    return min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) + random.uniform(0, BACKOFF_JITTER)
+
+
+def iter_products(html: bytes) -> Iterator[Dict[str, str]]:
+    """
+    Lazily extract product details from HTML.
+    
+    Args:
+        html: Raw UTF-8 HTML bytes
+    Yields:
+        Product dictionaries, one per product container
+    """
+    tree = LexborHTMLParser(html)
+    
+    # Find all products
+    product_containers = tree.css('div.tUxRFH')
+    logger.info("Found %d product containers", len(product_containers))
+    scraped_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    for idx, product in enumerate(product_containers, 1):
+        try:
+            # Extract product name
+            name_elem = product.css_first('div.KzDlHZ')
+            name = name_elem.text().strip() if name_elem else "N/A"
+            
+            # Extract product price
+            price_elem = product.css_first('div.Nx9bqj._4b5DiR')
+            price = price_elem.text().strip() if price_elem else "N/A"
+            
+            # Extract product rating
+            rating_elem = product.css_first('div.XQDdHH')
+            rating = rating_elem.text().strip() if rating_elem else "N/A"
+            
+            # Extract product link
+            link_elem = product.css_first('a.CGtC98')
+            href = link_elem.attributes.get('href') if link_elem else None
+            link = f"https://www.flipkart.com{href}" if href else "N/A"
+            
+            product_data = {
+                'Name': name,
+                'Price': price,
+                'Rating': rating,
+                'Link': link,
+                'Scraped_At': scraped_at
+            }
+        
+        except Exception as e:
+            logger.error("Error extracting product %d: %s", idx, e)
+            continue
+        
+        logger.debug("Extracted product %d: %s", idx, name)
+        yield product_data
+
+
+# Marks the end of one query's pages on its writer queue in scrape_many
+_QUERY_DONE = object()
+
+
+def _parse_page(html: Optional[bytes]) -> Tuple[List[Dict[str, str]], float]:
+    """Parse one fetched search page inside a worker process, timing the parse."""
+    start = time.perf_counter()
+    products = list(iter_products(html)) if html else []
+    return products, time.perf_counter() - start
 
 
 class WebScraper:
     """Advanced web scraper with enhanced error handling and features."""
     
-    def __init__(self, base_url: str, delay: int = 2, max_retries: int = 3):
+    def __init__(self, base_url: str, delay: float = 2, max_retries: int = 3, concurrency: int = 8,
+                 profile: bool = False, rate: Optional[float] = None):
         """
         Initialize the web scraper.
         
@@ -20,26 +200,72 @@ class WebScraper:
             base_url: Base URL for scraping
             delay: Delay between requests in seconds
             max_retries: Maximum number of retry attempts
+            concurrency: Maximum concurrent requests for async scraping
+            profile: Log a timing breakdown after each scrape
+            rate: Maximum requests per second across all fetches; overrides `delay` when given
         """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
         self.base_url = base_url
         self.delay = delay
         self.max_retries = max_retries
+        self.concurrency = concurrency
+        self.profile = profile
+        self.rate = rate if rate is not None else (1 / delay if delay > 0 else 0)
+        self.limiter = RateLimiter(self.rate)
+        self.timings = defaultdict(float)
+        self.profile_started = time.perf_counter()
         self.session = requests.Session()
-        self.setup_logging()
-        
-    def setup_logging(self):
-        """Setup logging configuration."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('scraper.log'),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
-    
-    def fetch(self, url: str) -> Optional[str]:
+        self.session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        self.session.headers.update(HEADERS)
+        self.logger = logger
+    
+    @contextmanager
+    def timed(self, key: str):
+        """Accumulate the wall time of the enclosed block under `key`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[key] += time.perf_counter() - start
+    
+    def start_profile(self):
+        """Reset the timing breakdown and start the wall clock for a new scrape."""
+        self.timings.clear()
+        self.profile_started = time.perf_counter()
+    
+    def log_profile(self):
+        """Log the accumulated timing breakdown when profiling is enabled."""
+        if not self.profile:
+            return
+        self.logger.info("Wall time: %.3fs", time.perf_counter() - self.profile_started)
+        # Concurrent tasks each add their own durations, so these can exceed wall time
+        self.logger.info("Timing breakdown (summed across concurrent tasks):")
+        for key, seconds in sorted(self.timings.items(), key=lambda item: -item[1]):
+            self.logger.info("  %-15s %8.3fs", key, seconds)
+    
+    def honor_retry_after(self, value: Optional[str]) -> bool:
+        """
+        Push back the rate limiter when the server sends a Retry-After header.
+        
+        Args:
+            value: Raw Retry-After header value, if any
+            
+        Returns:
+            False if the requested wait exceeds RETRY_AFTER_MAX and the URL should be given up
+        """
+        retry_after = parse_retry_after(value)
+        if retry_after is None:
+            return True
+        if retry_after > RETRY_AFTER_MAX:
+            self.logger.error("Server asked to retry after %.1f seconds (limit %.0f); giving up",
+                              retry_after, RETRY_AFTER_MAX)
+            return False
+        self.logger.info("Server asked to retry after %.1f seconds", retry_after)
+        self.limiter.defer(retry_after)
+        return True
+    
+    def fetch(self, url: str) -> Optional[bytes]:
         """
         Fetch HTML content with retry logic.
         
@@ -47,125 +273,137 @@ class WebScraper:
             url: URL to fetch
             
         Returns:
-            HTML content as string or None if failed
+            Raw HTML bytes or None if failed
         """
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
-        }
-        
         for attempt in range(self.max_retries):
+            self.timings['rate_limit'] += self.limiter.wait()
+            start = time.perf_counter()
             try:
-                self.logger.info(f"Fetching URL (Attempt {attempt + 1}/{self.max_retries}): {url}")
-                response = self.session.get(url, headers=headers, timeout=10)
+                self.logger.info("Fetching URL (Attempt %d/%d): %s", attempt + 1, self.max_retries, url)
+                response = self.session.get(url, timeout=10)
                 response.raise_for_status()
-                time.sleep(self.delay)
-                return response.text
+                self.timings['fetch'] += time.perf_counter() - start
+                return response.content
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                self.timings['failed_fetch'] += time.perf_counter() - start
+                self.logger.error("Error fetching URL: %s", e)
+                if isinstance(e, requests.HTTPError):
+                    if e.response.status_code not in RETRY_STATUSES:
+                        return None
+                    if not self.honor_retry_after(e.response.headers.get('Retry-After')):
+                        return None
             except requests.RequestException as e:
-                self.logger.error(f"Error fetching URL: {e}")
-                if attempt < self.max_retries - 1:
-                    wait_time = (attempt + 1) * 2
-                    self.logger.info(f"Retrying in {wait_time} seconds...")
+                self.logger.error("Error fetching URL: %s", e)
+                return None
+            
+            if attempt < self.max_retries - 1:
+                wait_time = backoff_delay(attempt)
+                self.logger.info("Retrying in %.1f seconds...", wait_time)
+                with self.timed('retry_backoff'):
                     time.sleep(wait_time)
-                else:
-                    self.logger.error(f"Failed to fetch URL after {self.max_retries} attempts")
-                    return None
+        
+        self.logger.error("Failed to fetch URL after %d attempts", self.max_retries)
+        return None
     
-    def extract_products(self, html: str) -> List[Dict[str, str]]:
+    def extract_products(self, html: bytes) -> List[Dict[str, str]]:
         """
         Extract product details from HTML.
         
         Args:
-            html: HTML content as string            
+            html: Raw UTF-8 HTML bytes
         Returns:
             List of product dictionaries
         """
-        soup = BeautifulSoup(html, 'html.parser')
-        products = []
-        
-        # Find all products
-        product_containers = soup.find_all('div', class_='tUxRFH')
-        self.logger.info(f"Found {len(product_containers)} product containers")
+        return list(self.iter_products(html))
+    
+    def iter_products(self, html: bytes) -> Iterator[Dict[str, str]]:
+        """
+        Lazily extract product details from HTML.
         
-        for idx, product in enumerate(product_containers, 1):
-            try:
-                # Extract product name
-                name_elem = product.find('div', class_='KzDlHZ')
-                name = name_elem.text.strip() if name_elem else "N/A"
-                
-                # Extract product price
-                price_elem = product.find('div', class_='Nx9bqj _4b5DiR')
-                price = price_elem.text.strip() if price_elem else "N/A"
-                
-                # Extract product rating
-                rating_elem = product.find('div', class_='XQDdHH')
-                rating = rating_elem.text.strip() if rating_elem else "N/A"
-                
-                # Extract product link
-                link_elem = product.find('a', class_='CGtC98')
-                link = f"https://www.flipkart.com{link_elem['href']}" if link_elem and 'href' in link_elem.attrs else "N/A"
-                
-                product_data = {
-                    'Name': name,
-                    'Price': price,
-                    'Rating': rating,
-                    'Link': link,
-                    'Scraped_At': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                
-                products.append(product_data)
-                self.logger.debug(f"Extracted product {idx}: {name}")
-                
-            except Exception as e:
-                self.logger.error(f"Error extracting product {idx}: {e}")
-                continue
-        
-        return products
-    
-    def save_to_csv(self, products: List[Dict], filename: str = 'products.csv'):
-        """
-        Save products to CSV file.
+        Args:
+            html: Raw UTF-8 HTML bytes
+        Yields:
+            Product dictionaries, one per product container
+        """
+        return iter_products(html)
+    
+    def save_to_csv(self, products: Iterable[Dict], filename: str = 'products.csv') -> int:
+        """
+        Save products to CSV file, writing each row as it is produced.
         
         Args:
-            products: List of product dictionaries
+            products: Iterable of product dictionaries
             filename: Output filename
+            
+        Returns:
+            Number of products written
         """
-        if not products:
+        products = iter(products)
+        first = next(products, None)
+        if first is None:
             self.logger.warning("No products to save")
-            return
+            return 0
         
+        count = 0
         try:
-            fieldnames = ['Name', 'Price', 'Rating', 'Link', 'Scraped_At']
             with open(filename, 'w', newline='', encoding='utf-8') as file:
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(products)
-            self.logger.info(f"Successfully saved {len(products)} products to {filename}")
+                writer = csv.writer(file)
+                writer.writerow(FIELDNAMES)
+                for p in chain((first,), products):
+                    writer.writerow((p['Name'], p['Price'], p['Rating'], p['Link'], p['Scraped_At']))
+                    count += 1
+            self.logger.info("Successfully saved %d products to %s", count, filename)
         except Exception as e:
-            self.logger.error(f"Error saving to CSV: {e}")
+            self.logger.error("Error saving to CSV: %s", e)
+        return count
     
-    def save_to_json(self, products: List[Dict], filename: str = 'products.json'):
+    def save_to_json(self, products: Iterable[Dict], filename: str = 'products.json',
+                     compact: bool = False) -> int:
         """
         Save products to JSON file.
         
         Args:
-            products: List of product dictionaries
+            products: Iterable of product dictionaries
             filename: Output filename
+            compact: Write minified JSON for machine consumption instead of indented output
+            
+        Returns:
+            Number of products written
         """
+        products = list(products)
         if not products:
             self.logger.warning("No products to save")
-            return
+            return 0
         
         try:
-            with open(filename, 'w', encoding='utf-8') as file:
-                json.dump(products, file, indent=2, ensure_ascii=False)
-            self.logger.info(f"Successfully saved {len(products)} products to {filename}")
+            # orjson emits UTF-8 bytes and never escapes non-ASCII characters
+            option = 0 if compact else orjson.OPT_INDENT_2
+            with open(filename, 'wb') as file:
+                file.write(orjson.dumps(products, option=option))
+            self.logger.info("Successfully saved %d products to %s", len(products), filename)
+            return len(products)
         except Exception as e:
-            self.logger.error(f"Error saving to JSON: {e}")
+            self.logger.error("Error saving to JSON: %s", e)
+            return 0
     
-    def scrape(self, search_query: str, output_format: str = 'csv', output_filename: str = None):
+    def build_url(self, search_query: str, page: Optional[int] = None) -> str:
+        """
+        Build a search URL with the query properly percent-encoded.
+        
+        Args:
+            search_query: Product search query
+            page: Result page number, omitted when None
+            
+        Returns:
+            Search URL
+        """
+        params = {'q': search_query}
+        if page is not None:
+            params['page'] = page
+        return f"{self.base_url}?{urlencode(params)}"
+    
+    def scrape(self, search_query: str, output_format: str = 'csv', output_filename: str = None,
+               compact: bool = False):
         """
         Main scraping function.
         
@@ -173,22 +411,222 @@ class WebScraper:
             search_query: Product search query
             output_format: Output format ('csv' or 'json')
             output_filename: Custom output filename (without extension)
+            compact: Write minified JSON
         """
-        url = f"{self.base_url}?q={search_query.replace(' ', '+'')}"
+        self.start_profile()
+        url = self.build_url(search_query)
         
-        self.logger.info(f"Starting scrape for query: {search_query}")
+        self.logger.info("Starting scrape for query: %s", search_query)
         html = self.fetch(url)
         
         if not html:
             self.logger.error("Failed to fetch HTML content")
             return
         
-        products = self.extract_products(html)
+        with self.timed('parse_and_save'):
+            count = self.save_products(self.iter_products(html), search_query, output_format,
+                                       output_filename, compact)
         
-        if not products:
-            self.logger.warning("No products found")
+        if not count:
+            return
+        
+        self.logger.info("Scraping completed. Found %d products", count)
+        self.log_profile()
+    
+    async def afetch(self, session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+        """
+        Fetch HTML content asynchronously with retry logic.
+        
+        Args:
+            session: Shared aiohttp client session
+            url: URL to fetch
+            
+        Returns:
+            Raw HTML bytes or None if failed
+        """
+        for attempt in range(self.max_retries):
+            self.timings['rate_limit'] += await self.limiter.async_wait()
+            start = time.perf_counter()
+            try:
+                self.logger.info("Fetching URL (Attempt %d/%d): %s", attempt + 1, self.max_retries, url)
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    html = await response.read()
+                self.timings['fetch'] += time.perf_counter() - start
+                return html
+            except (aiohttp.ClientConnectionError, aiohttp.ClientResponseError, asyncio.TimeoutError) as e:
+                self.timings['failed_fetch'] += time.perf_counter() - start
+                self.logger.error("Error fetching URL: %s", e)
+                if isinstance(e, aiohttp.ClientResponseError):
+                    if e.status not in RETRY_STATUSES:
+                        return None
+                    if not self.honor_retry_after(e.headers.get('Retry-After') if e.headers else None):
+                        return None
+            except aiohttp.ClientError as e:
+                self.logger.error("Error fetching URL: %s", e)
+                return None
+            
+            if attempt < self.max_retries - 1:
+                wait_time = backoff_delay(attempt)
+                self.logger.info("Retrying in %.1f seconds...", wait_time)
+                with self.timed('retry_backoff'):
+                    await asyncio.sleep(wait_time)
+        
+        self.logger.error("Failed to fetch URL after %d attempts", self.max_retries)
+        return None
+    
+    @asynccontextmanager
+    async def open_fetcher(self):
+        """
+        Open one shared, rate-limited aiohttp session for concurrent fetches.
+        
+        Yields:
+            Coroutine function taking a URL and returning raw HTML bytes or None,
+            bounded to `concurrency` requests in flight
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit_per_host=self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with aiohttp.ClientSession(connector=connector, headers=HEADERS, timeout=timeout) as session:
+            async def bounded_fetch(url):
+                async with semaphore:
+                    return await self.afetch(session, url)
+            
+            yield bounded_fetch
+    
+    async def afetch_all(self, urls: List[str]) -> List[Optional[bytes]]:
+        """
+        Fetch several URLs concurrently through one shared, rate-limited session.
+        
+        Args:
+            urls: URLs to fetch
+            
+        Returns:
+            Raw HTML bytes (or None if failed) for each URL, in order
+        """
+        async with self.open_fetcher() as fetch:
+            return await asyncio.gather(*[fetch(url) for url in urls])
+    
+    async def ascrape(self, search_query: str, pages: int = 1, output_format: str = 'csv',
+                      output_filename: str = None, compact: bool = False):
+        """
+        Scrape several result pages concurrently.
+        
+        Args:
+            search_query: Product search query
+            pages: Number of result pages to fetch
+            output_format: Output format ('csv' or 'json')
+            output_filename: Custom output filename (without extension)
+            compact: Write minified JSON
+        """
+        self.start_profile()
+        urls = [self.build_url(search_query, page) for page in range(1, pages + 1)]
+        
+        self.logger.info("Starting scrape for query: %s (%d pages)", search_query, pages)
+        pages_html = await self.afetch_all(urls)
+        
+        products = (product for html in pages_html if html for product in self.iter_products(html))
+        with self.timed('parse_and_save'):
+            count = self.save_products(products, search_query, output_format, output_filename, compact)
+        
+        if not count:
             return
         
+        self.logger.info("Scraping completed. Found %d products", count)
+        self.log_profile()
+    
+    def scrape_many(self, search_queries: List[str], pages: int = 1, output_format: str = 'csv',
+                    output_filename: str = None, compact: bool = False, workers: Optional[int] = None):
+        """
+        Scrape several queries, parsing pages in worker processes.
+        
+        Pages are fetched by this process through the shared rate-limited
+        session, so the request rate and any Retry-After apply to all queries
+        together. Each page is handed to the worker pool as soon as it arrives
+        and its bytes are dropped once parsed, so fetching and parsing overlap.
+        Parsed products go through a queue per query to a single writer thread,
+        which writes one file per query in arrival order.
+        
+        Args:
+            search_queries: Product search queries; repeated queries are scraped once
+            pages: Number of result pages to fetch per query
+            output_format: Output format ('csv' or 'json')
+            output_filename: Custom output filename prefix (without extension)
+            compact: Write minified JSON
+            workers: Number of worker processes (default: CPU count)
+        """
+        self.start_profile()
+        queries = list(dict.fromkeys(search_queries))
+        if len(queries) < len(search_queries):
+            self.logger.warning("Ignoring %d duplicate queries", len(search_queries) - len(queries))
+        workers = workers or os.cpu_count()
+        self.logger.info("Starting scrape for %d queries with %d workers", len(queries), workers)
+        
+        queues = {query: queue.Queue() for query in queries}
+        totals = []
+        
+        def drain(query_queue):
+            while True:
+                products = query_queue.get()
+                if products is _QUERY_DONE:
+                    return
+                yield from products
+        
+        def write_all():
+            for query in queries:
+                filename = f"{output_filename}_{query.replace(' ', '_')}" if output_filename else None
+                totals.append(self.save_products(drain(queues[query]), query, output_format,
+                                                 filename, compact))
+        
+        writer = threading.Thread(target=write_all)
+        writer.start()
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                asyncio.run(self._afetch_and_parse(queries, pages, pool, queues))
+        finally:
+            # Release the writer even if fetching failed part-way
+            for query_queue in queues.values():
+                query_queue.put(_QUERY_DONE)
+            writer.join()
+        
+        self.logger.info("Scraping completed. Found %d products", sum(totals))
+        self.log_profile()
+    
+    async def _afetch_and_parse(self, queries: List[str], pages: int, pool: ProcessPoolExecutor,
+                                queues: Dict[str, queue.Queue]):
+        """Fetch every page of every query and parse each one in `pool` as it arrives."""
+        loop = asyncio.get_running_loop()
+        
+        async with self.open_fetcher() as fetch:
+            async def fetch_and_parse(query, page):
+                html = await fetch(self.build_url(query, page))
+                if not html:
+                    return
+                products, seconds = await loop.run_in_executor(pool, _parse_page, html)
+                self.timings['parse'] += seconds
+                queues[query].put(products)
+            
+            async def scrape_query(query):
+                await asyncio.gather(*[fetch_and_parse(query, page) for page in range(1, pages + 1)])
+                queues[query].put(_QUERY_DONE)
+            
+            await asyncio.gather(*[scrape_query(query) for query in queries])
+    
+    def save_products(self, products: Iterable[Dict], search_query: str, output_format: str = 'csv',
+                      output_filename: str = None, compact: bool = False) -> int:
+        """
+        Save products in the requested format.
+        
+        Args:
+            products: Iterable of product dictionaries
+            search_query: Product search query, used for the default filename
+            output_format: Output format ('csv' or 'json')
+            output_filename: Custom output filename (without extension)
+            compact: Write minified JSON
+            
+        Returns:
+            Number of products saved
+        """
         # Generate filename if not provided
         if not output_filename:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -196,41 +634,66 @@ class WebScraper:
         
         # Save based on format
         if output_format.lower() == 'json':
-            self.save_to_json(products, f"{output_filename}.json")
-        else:
-            self.save_to_csv(products, f"{output_filename}.csv")
-        
-        self.logger.info(f"Scraping completed. Found {len(products)} products")
+            return self.save_to_json(products, f"{output_filename}.json", compact=compact)
+        return self.save_to_csv(products, f"{output_filename}.csv")
+
+
+def positive_int(value: str) -> int:
+    """Argparse type for integers of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main():
     """Main function with CLI argument parsing."""
     parser = argparse.ArgumentParser(description='Advanced Flipkart Web Scraper')
-    parser.add_argument('--query', '-q', type=str, default='laptops',
-                        help='Search query for products (default: laptops)')
+    parser.add_argument('--query', '-q', type=str, nargs='+', default=['laptops'],
+                        help='One or more search queries for products (default: laptops)')
     parser.add_argument('--format', '-f', type=str, choices=['csv', 'json'], default='csv',
                         help='Output format: csv or json (default: csv)')
     parser.add_argument('--output', '-o', type=str, default=None,
                         help='Output filename without extension')
-    parser.add_argument('--delay', '-d', type=int, default=2,
+    parser.add_argument('--compact', action='store_true',
+                        help='Write minified JSON instead of indented output')
+    parser.add_argument('--delay', '-d', type=float, default=2,
                         help='Delay between requests in seconds (default: 2)')
+    parser.add_argument('--rate', type=float, default=None,
+                        help='Maximum requests per second, shared by all queries and pages; '
+                             'overrides --delay (default: 1 / delay)')
     parser.add_argument('--retries', '-r', type=int, default=3,
                         help='Maximum retry attempts (default: 3)')
+    parser.add_argument('--pages', '-p', type=int, default=1,
+                        help='Number of result pages to fetch (default: 1)')
+    parser.add_argument('--concurrency', '-c', type=positive_int, default=8,
+                        help='Maximum concurrent requests (default: 8)')
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                        help='Worker processes when scraping several queries (default: CPU count)')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Enable verbose logging')
+    parser.add_argument('--profile', action='store_true',
+                        help='Log wall time and a per-phase timing breakdown summed across tasks')
     
     args = parser.parse_args()
     
-    # Set logging level
+    # Configure logging before applying the level so basicConfig cannot reset it
+    setup_logging()
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
     # Initialize scraper
     base_url = "https://www.flipkart.com/search"
-    scraper = WebScraper(base_url, delay=args.delay, max_retries=args.retries)
+    scraper = WebScraper(base_url, delay=args.delay, max_retries=args.retries,
+                         concurrency=args.concurrency, profile=args.profile, rate=args.rate)
     
     # Run scraper
-    scraper.scrape(args.query, output_format=args.format, output_filename=args.output)
+    if len(args.query) > 1:
+        scraper.scrape_many(args.query, pages=args.pages, output_format=args.format,
+                            output_filename=args.output, compact=args.compact, workers=args.workers)
+    else:
+        asyncio.run(scraper.ascrape(args.query[0], pages=args.pages, output_format=args.format,
+                                    output_filename=args.output, compact=args.compact))
 
 
 if __name__ == "__main__":
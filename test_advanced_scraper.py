@@ -0,0 +1,54 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from advanced_scraper import RateLimiter, parse_retry_after
+
+
+def test_async_wait_honors_defer_from_another_task():
+    """Tasks already holding a slot must not send inside a Retry-After window."""
+    limiter = RateLimiter(20)
+    sent = {}
+    
+    async def request(page: int):
+        await limiter.async_wait()
+        sent[page] = time.monotonic()
+        if page == 1:
+            # First response is a 429 with Retry-After, seen after the others reserved slots
+            await asyncio.sleep(0.01)
+            limiter.defer(0.5)
+    
+    async def run():
+        await asyncio.gather(*[request(page) for page in range(1, 6)])
+    
+    asyncio.run(run())
+    
+    later = sorted(sent[page] for page in range(2, 6))
+    assert later[0] - sent[1] >= 0.5
+    assert all(b - a >= limiter.interval * 0.9 for a, b in zip(later, later[1:]))
+
+
+def test_wait_spaces_requests_at_fixed_interval():
+    limiter = RateLimiter(20)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.wait()
+    assert time.monotonic() - start >= 4 * limiter.interval * 0.9
+
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after('5') == 5.0
+    assert parse_retry_after(' 120 ') == 120.0
+
+
+def test_parse_retry_after_http_date():
+    future = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 <= parse_retry_after(format_datetime(future, usegmt=True)) <= 30
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+
+
+def test_parse_retry_after_missing_or_junk():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('') is None
+    assert parse_retry_after('soon') is None